@@ -10,7 +10,7 @@ import logging
 import enum
 from datetime import datetime, timedelta
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import Integer, Boolean, Float, Date, Interval
+from sqlalchemy import Integer, Boolean, Float, Date, Interval, func
 
 logger = logging.getLogger("flask.app")
 
@@ -165,12 +165,35 @@ class Promotion(db.Model):
         logger.info("Deleted %d record(s).", count)
         return count  # Return the number of deleted records
 
+    @classmethod
+    def bulk_create(cls, mappings):
+        """Creates many Promotions in the database with one batched INSERT
+
+        Args:
+            mappings (list[dict]): column-name to value dictionaries,
+                one per Promotion to insert
+        """
+        logger.info("Bulk creating %d promotion(s)", len(mappings))
+        try:
+            db.session.bulk_insert_mappings(cls, mappings)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error("Error bulk creating Promotions: %s", e)
+            raise DataValidationError(e) from e
+
     @classmethod
     def all(cls):
         """Returns all of the Promotions in the database"""
         logger.info("Processing all Promotions")
         return cls.query.all()
 
+    @classmethod
+    def count(cls):
+        """Returns the number of Promotions in the database"""
+        logger.info("Counting all Promotions")
+        return db.session.query(func.count(cls.id)).scalar()
+
     @classmethod
     def find(cls, by_id):
         """Finds a Promotion by it's ID"""
@@ -228,7 +251,9 @@ class Promotion(db.Model):
             DataValidationError: If any field in query_params is not a valid attribute of the model.
         """
         query = cls.query
-        for field_name, value in query_params.items():
+        # Apply filters in canonical key order so repeated calls with the
+        # same fields reuse one compiled statement from the SQL cache
+        for field_name, value in sorted(query_params.items()):
             if not hasattr(cls, field_name):
                 raise DataValidationError(
                     f"Field '{field_name}' is not a valid attribute of {cls.__name__}."
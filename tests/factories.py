@@ -27,3 +27,16 @@ class PromotionFactory(factory.Factory):
     created_date = LazyFunction(date.today)
     duration = LazyFunction(lambda: timedelta(days=random.randint(1, 30)))
     active = Faker("boolean")
+
+
+def make_promotions(count):
+    """Builds count promotion payloads and inserts them in one batch
+
+    Returns the list of column dictionaries that were inserted.
+    """
+    payloads = [
+        {key: value for key, value in vars(promotion).items() if not key.startswith("_")}
+        for promotion in PromotionFactory.build_batch(count)
+    ]
+    Promotion.bulk_create(payloads)
+    return payloads